@@ -6,12 +6,20 @@
     :license: MIT, see LICENSE for more details.
 """
 
+import asyncio
 import collections
+import json
 
 import aiohttp
-import attr
 import yarl
 
+try:
+    import orjson
+except ImportError:
+    _json_loads = json.loads
+else:
+    _json_loads = orjson.loads
+
 from .enums import CategoryType
 from .errors import InvalidParameter, NoResults, TokenEmpty, TokenNotFound
 from .iterators import _AsyncQuestionsIterator, _QuestionsIterator
@@ -19,7 +27,55 @@ from .objects import Category, Count, GlobalCount
 
 __all__ = ('Settings', 'Client')
 
-@attr.s(slots=True)
+# bodies at least this many bytes have their preprocess + parse step pushed
+# off the event loop; smaller ones are cheaper to handle inline than to
+# dispatch to a worker thread
+_PREPROCESS_OFFLOAD_THRESHOLD = 4096
+
+def _preprocess_loads(preprocess, raw):
+    return _json_loads(preprocess(raw))
+
+class _CacheView(collections.abc.Sequence):
+    """Read-only sequence view over an internal cache container.
+
+    The view reflects the live cache state without copying it; callers that need a
+    snapshot can pass the view to :class:`list`.
+    """
+
+    __slots__ = ('_source',)
+
+    def __init__(self, source):
+        self._source = source
+
+    def __len__(self):
+        return len(self._source)
+
+    def __iter__(self):
+        return iter(self._source)
+
+    def __getitem__(self, index):
+        source = self._source
+        if isinstance(index, slice):
+            return list(source)[index]
+
+        try:
+            return source[index]
+        except TypeError:
+            # dict value views are ordered but not indexable
+            pass
+
+        length = len(source)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError('view index out of range')
+        for current, value in enumerate(source):
+            if current == index:
+                return value
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(type(self).__name__, list(self._source))
+
 class Settings:
     """Dataclass representing a cache settings for :class:`.Client`.
 
@@ -53,18 +109,36 @@ class Settings:
         Encoding of the API responses to be used.
     """
 
-    token = attr.ib(False, kw_only=True)
-    questions = attr.ib(False, kw_only=True)
-    categories = attr.ib(False, kw_only=True)
-    counts = attr.ib(False, kw_only=True)
-    global_counts = attr.ib(False, kw_only=True)
+    __slots__ = (
+        'token', 'questions', 'categories', 'counts', 'global_counts', 'overwrite', 'category',
+        'difficulty', 'question', 'encoding'
+    )
+
+    def __init__(
+        self, *,
+        token=False,
+        questions=False,
+        categories=False,
+        counts=False,
+        global_counts=False,
+        overwrite=False,
+        category=None,
+        difficulty=None,
+        question=None,
+        encoding=None
+    ):
+        self.token = token
+        self.questions = questions
+        self.categories = categories
+        self.counts = counts
+        self.global_counts = global_counts
 
-    overwrite = attr.ib(False, kw_only=True)
+        self.overwrite = overwrite
 
-    category = attr.ib(None, kw_only=True)
-    difficulty = attr.ib(None, kw_only=True)
-    question = attr.ib(None, kw_only=True)
-    encoding = attr.ib(None, kw_only=True)
+        self.category = category
+        self.difficulty = difficulty
+        self.question = question
+        self.encoding = encoding
 
 class Client:
     """Class representing an OpenTDB client.
@@ -91,7 +165,9 @@ class Client:
     session: Optional[:class:`aiohttp.ClientSession`]
         Session to be used when performing HTTP requests.
 
-        If ``None``, a new session will be created automatically when performing HTTP requests.
+        If ``None``, a new session with a keep-alive tuned connector will be created
+        automatically when performing HTTP requests. Users passing their own session
+        should configure their own connector.
     settings: :class:`.Settings`
         Settings to be used when populating the internal cache.
     """
@@ -118,6 +194,8 @@ class Client:
         self.session = session
         self.settings = settings or Settings()
 
+        self._owns_session = session is None
+
         self._token = None
         self._questions = collections.deque(maxlen=max_questions)
         self._categories = {}
@@ -132,33 +210,71 @@ class Client:
 
     @property
     def questions(self):
-        """List[:class:`.Question`]: List of cached questions. Empty when not populated."""
-        return list(self._questions)
+        """Sequence[:class:`.Question`]: Read-only view of the cached questions.
+        Empty when not populated.
+        """
+
+        return _CacheView(self._questions)
 
     @property
     def categories(self):
-        """List[:class:`.Category`]: List of cached categories. Empty when not populated."""
+        """Sequence[:class:`.Category`]: Read-only view of the cached categories.
+        Empty when not populated.
+        """
 
-        return list(self._categories.values())
+        return _CacheView(self._categories.values())
 
     @property
     def counts(self):
-        """List[:class:`.Count`]: List of cached counts. Empty when not populated."""
+        """Sequence[:class:`.Count`]: Read-only view of the cached counts.
+        Empty when not populated.
+        """
 
-        return list(self._counts.values())
+        return _CacheView(self._counts.values())
 
     @property
     def global_counts(self):
-        """List[:class:`.GlobalCount`]: List of cached global counts. Empty when not populated."""
+        """Sequence[:class:`.GlobalCount`]: Read-only view of the cached global counts.
+        Empty when not populated.
+        """
 
-        return list(self._global_counts.values())
+        return _CacheView(self._global_counts.values())
 
-    async def _request(self, method, endpoint, **options):
+    def _create_session(self):
+        from . import __version__
+
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=8,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            raise_for_status=True,
+            headers={'User-Agent': 'aiopentdb/{0}'.format(__version__)}
+        )
+
+    async def _request(self, method, endpoint, preprocess=None, **options):
         if self.session is None:
-            self.session = aiohttp.ClientSession(raise_for_status=True)
+            self.session = self._create_session()
 
         async with self.session.request(method, self._BASE_URL / endpoint, **options) as response:
-            payload = await response.json()
+            # the API always responds with UTF-8 JSON, so parse the raw bytes
+            # directly instead of going through response.json()'s content-type
+            # and charset detection
+            raw = await response.read()
+
+        if preprocess is None:
+            payload = _json_loads(raw)
+        elif len(raw) >= _PREPROCESS_OFFLOAD_THRESHOLD:
+            # the bulk entity pass plus parse is the dominant CPU cost on the
+            # default encoding; run it off-loop for large bodies so it does
+            # not stall concurrent fetches
+            loop = asyncio.get_running_loop()
+            payload = await loop.run_in_executor(None, _preprocess_loads, preprocess, raw)
+        else:
+            payload = _preprocess_loads(preprocess, raw)
 
         error_type = self._ERRORS[payload.pop('response_code', None)]
         if error_type is not None:
@@ -357,14 +473,23 @@ class Client:
     async def fetch_categories(self):
         """Fetches all categories.
 
+        Categories are static, so the result is memoized into the internal category cache;
+        only the first call performs an HTTP request.
+
         Returns
         -------
         List[:class:`.Category`]
             List of fetched categories.
         """
 
+        if self._categories:
+            return list(self._categories.values())
+
         payload = await self._request('GET', 'api_category.php')
-        return self._create_categories(payload['trivia_categories'])
+        categories = self._create_categories(payload['trivia_categories'])
+        for category in categories:
+            self._categories[category.type] = category
+        return categories
 
     def get_category(self, type):
         """Retrieves a category from the internal category cache.
@@ -380,7 +505,7 @@ class Client:
             Cached category. ``None`` when not cached.
         """
 
-        return self._categories.get(type.value)
+        return self._categories.get(type)
 
     # count
 
@@ -401,9 +526,7 @@ class Client:
             Fetched count.
         """
 
-        params = {
-            'category': category.value
-        }
+        params = [('category', category.value)]
         payload = await self._request('GET', 'api_count.php', params=params)
 
         actual_payload = payload['category_question_count']
@@ -424,7 +547,7 @@ class Client:
             Cached count. ``None`` when not cached.
         """
 
-        return self._counts.get(category.value)
+        return self._counts.get(category)
 
     # global count
 
@@ -461,10 +584,29 @@ class Client:
             Cached global count. ``None`` when not cached.
         """
 
-        return self._global_counts.get(category.value if category is not None else None)
+        return self._global_counts.get(category)
 
     # tools
 
+    async def warm_up(self, amount=4):
+        """Pre-opens keep-alive connections to the API.
+
+        This primes the session's connection pool so request bursts such as
+        :meth:`~.Client.populate` skip the per-connection TCP and TLS handshakes.
+
+        Parameters
+        ----------
+        amount: :class:`int`
+            Number of connections to be opened.
+
+            Defaults to ``4``.
+        """
+
+        async def ping():
+            await self._request('GET', 'api_category.php')
+
+        await asyncio.gather(*(ping() for _ in range(amount)))
+
     async def populate(self, settings=None):
         """Populates the internal cache.
 
@@ -478,15 +620,22 @@ class Client:
 
         settings = settings or self.settings
 
+        if self.session is None:
+            await self.warm_up()
+
         if settings.token:
             if self._token is None or settings.overwrite:
                 self._token = await self.fetch_token()
 
         if settings.questions:
+            maxlen = self._questions.maxlen
+
             if settings.overwrite:
-                questions_amount = self._questions.maxlen
+                # extending a full deque evicts the oldest entries in O(1),
+                # so overwriting never needs to clear or pre-slice the cache
+                questions_amount = maxlen
             else:
-                questions_amount = self._questions.maxlen - len(self._questions)
+                questions_amount = maxlen - len(self._questions)
 
             if questions_amount > 0:
                 questions_iterator = self.fetch_questions(
@@ -499,26 +648,29 @@ class Client:
                 self._questions.extend(await questions_iterator.flatten())
 
         if settings.categories:
-            if not self._categories or settings.overwrite:
-                for category in await self.fetch_categories():
-                    self._categories[category.type.value] = category
+            if settings.overwrite:
+                self._categories.clear()
+            await self.fetch_categories()
 
         if settings.counts:
             if not self._counts or settings.overwrite:
-                for category_id in Category._VALUE_MAPPING:
-                    category_type = CategoryType(category_id)
-                    self._counts[category_type.value] = await self.fetch_count(category_type)
+                category_types = list(CategoryType)
+                counts = await asyncio.gather(*map(self.fetch_count, category_types))
+                for category_type, count in zip(category_types, counts):
+                    self._counts[category_type] = count
 
         if settings.global_counts:
             if not self._global_counts or settings.overwrite:
                 for global_count in await self.fetch_global_counts():
                     category_type = getattr(global_count.category, 'type', None)
-                    category_value = category_type.value if category_type is not None else None
-                    self._global_counts[category_value] = global_count
+                    self._global_counts[category_type] = global_count
 
     async def close(self):
-        """Closes the internal session if exist."""
+        """Closes the internal session if exist.
 
-        if self.session is None:
+        Sessions supplied by the user are left open and must be closed by their owner.
+        """
+
+        if self.session is None or not self._owns_session:
             return
         await self.session.close()
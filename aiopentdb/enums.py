@@ -6,85 +6,16 @@
     :license: MIT, see LICENSE for more details.
 """
 
-import types
+import enum
 
 __all__ = ('CategoryType', 'DifficultyType', 'QuestionType', 'EncodingType')
 
-def _create_enum_type(name):
-    __slots__ = ('name', 'value')
+class _FromValue:
+    @classmethod
+    def from_value(cls, value):
+        return cls._value2member_map_[value]
 
-    def __init__(self, name, value):
-        self.name = name
-        self.value = value
-
-    def __repr__(self):
-        return '{0}(name={1.name}, value={1.value})'.format(name, self)
-
-    attributes = {
-        '__slots__': __slots__,
-        '__init__': __init__,
-        '__repr__': __repr__
-    }
-    return type(name, (), attributes)
-
-def _is_descriptor(object):
-    return any(hasattr(object, name) for name in ('__get__', '__set__', '__delete__'))
-
-class _EnumMeta(type):
-    def __new__(cls, name, bases, attributes):
-        enum_type = _create_enum_type(name)
-        name_mapping = {}
-        value_mapping = {}
-
-        for attribute_name, attribute_value in attributes.items():
-            if _is_descriptor(attribute_value):
-                setattr(enum_type, attribute_name, attribute_value)
-            else:
-                if attribute_name.startswith('_'):
-                    continue
-
-                enum = enum_type(attribute_name, attribute_value)
-                attributes[attribute_name] = enum
-                name_mapping[attribute_name] = enum
-                value_mapping[attribute_value] = enum
-
-        attributes['_name_mapping'] = name_mapping
-        attributes['_value_mapping'] = value_mapping
-        attributes['_enums'] = tuple(name_mapping.values())
-        return super().__new__(cls, name, bases, attributes)
-
-    def __getitem__(self, name):
-        return self._name_mapping[name]
-
-    def __call__(self, value):
-        return self._value_mapping[value]
-
-    def __setattr__(self, name, value):
-        raise TypeError(self.__name__ + ' is immutable')
-
-    def __delattr__(self, name):
-        raise TypeError(self.__name__ + ' is immutable')
-
-    def __iter__(self):
-        return iter(self._enums)
-
-    def __reversed__(self):
-        return reversed(self._enums)
-
-    def __contains__(self, enum):
-        return enum in self._enums
-
-    def __len__(self):
-        return len(self._enums)
-
-    @property
-    def __members__(self):
-        return types.MappingProxyType(self._name_mapping)
-
-class _Enum(metaclass=_EnumMeta):
-    ...
-
-class CategoryType(_Enum):
+class CategoryType(_FromValue, enum.IntEnum):
     """Enum representing an OpenTDB category type.
 
     This enum is used to denote type of :class:`.Category`.
@@ -166,10 +97,7 @@ class CategoryType(_Enum):
     anime_and_manga = 31
     cartoon_and_animations = 32
 
-    def __int__(self):
-        return self.value
-
-class DifficultyType(_Enum):
+class DifficultyType(_FromValue, str, enum.Enum):
     """Enum representing an OpenTDB difficulty type.
 
     This enum is used to denote difficulty type of :class:`.Question`.
@@ -191,7 +119,7 @@ class DifficultyType(_Enum):
     def __str__(self):
         return self.value
 
-class QuestionType(_Enum):
+class QuestionType(_FromValue, str, enum.Enum):
     """Enum representing an OpenTDB question type.
 
     This enum is used to denote type of :class:`.Question`.
@@ -210,7 +138,7 @@ class QuestionType(_Enum):
     def __str__(self):
         return self.value
 
-class EncodingType(_Enum):
+class EncodingType(_FromValue, str, enum.Enum):
     """Enum representing an OpenTDB encoding type.
 
     This enum is used to denote encoding type of an API response.
@@ -228,3 +156,8 @@ class EncodingType(_Enum):
 
     def __str__(self):
         return self.value
+
+# compatibility with the previous handwritten enum machinery
+for _enum_type in (CategoryType, DifficultyType, QuestionType, EncodingType):
+    _enum_type._value_mapping = _enum_type._value2member_map_
+del _enum_type
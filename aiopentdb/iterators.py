@@ -6,19 +6,105 @@
     :license: MIT, see LICENSE for more details.
 """
 
-import base64
-import html
-from urllib import parse
+import asyncio
+import json
+import re
 
 from .enums import EncodingType
 from .objects import Question
 
 __all__ = ()
 
+_MAX_CONCURRENT_FETCHES = 4
+_DECODE_OFFLOAD_THRESHOLD = 20
+
+_ENTITY_RE = re.compile(r'&(#[0-9]+|#[xX][0-9a-fA-F]+|[0-9a-zA-Z]+);')
+_ENTITIES = {
+    'quot': '"',
+    'amp': '&',
+    'apos': "'",
+    'lt': '<',
+    'gt': '>',
+    'nbsp': '\xa0'
+}
+
+def _lookup_entity(match):
+    # returns None for entities neither table knows, so callers can tell a
+    # miss apart from a genuine replacement
+    entity = match.group(1)
+    if entity[0] == '#':
+        if entity[1] in 'xX':
+            code = int(entity[2:], 16)
+        else:
+            code = int(entity[1:])
+        if 0xD800 <= code <= 0xDFFF or code > 0x10FFFF:
+            # match html.unescape: surrogate and out-of-range charrefs decode
+            # to the replacement character instead of blowing up chr() or the
+            # JSON parser downstream
+            return '\ufffd'
+        return chr(code)
+
+    replacement = _ENTITIES.get(entity)
+    if replacement is None:
+        # rare entities fall back to the full HTML5 table
+        from html.entities import html5
+        replacement = html5.get(entity + ';')
+    return replacement
+
+def _replace_entity(match):
+    replacement = _lookup_entity(match)
+    if replacement is None:
+        return match.group(0)
+    return replacement
+
+def _unescape(decodable):
+    if '&' in decodable:
+        return _ENTITY_RE.sub(_replace_entity, decodable)
+    return decodable
+
+def _identity(decodable):
+    return decodable
+
+def _replace_json_entity(match):
+    replacement = _lookup_entity(match)
+    if replacement is None:
+        # unknown entity: leave the original text untouched
+        return match.group(0)
+    # re-escape the decoded character so the substitution cannot break the
+    # surrounding JSON string literal (for example &quot; must become \")
+    return json.dumps(replacement)[1:-1]
+
+def _bulk_unescape(raw):
+    # one entity pass over the whole payload instead of one decoder call per
+    # field per question; entities only ever occur inside string values
+    text = raw.decode()
+    if '&' in text:
+        return _ENTITY_RE.sub(_replace_json_entity, text)
+    return text
+
+def _build_questions(client, payload, decoder):
+    create_question = Question
+
+    for data in payload:
+        data['name'] = data['category']
+        del data['category']
+    return [create_question(client, data, decoder) for data in payload]
+
+def _decode_url(decodable):
+    # imported lazily; most users never leave the default (HTML) encoding
+    from urllib.parse import unquote_to_bytes
+
+    return unquote_to_bytes(decodable).decode()
+
+def _decode_base64(decodable):
+    from base64 import b64decode
+
+    return b64decode(decodable).decode()
+
 class _QuestionsIterator:
     __slots__ = (
         '_client', '_questions', '_amount', '_category_type', '_difficulty_type', '_question_type',
-        '_consume', '_current'
+        '_consume', '_consumed', '_current'
     )
 
     def __init__(
@@ -30,13 +116,17 @@ class _QuestionsIterator:
         consume=False
     ):
         self._client = client
-        self._questions = iter(client.questions)
+        # iterate a snapshot, not the live deque: the cache may be mutated
+        # while this iterator is suspended (another consuming iterator
+        # flushing, populate() refilling) and deques forbid that mid-iteration
+        self._questions = iter(tuple(client._questions))
 
         self._amount = amount
         self._category_type = category
         self._difficulty_type = difficulty
         self._question_type = type
         self._consume = consume
+        self._consumed = set()
 
         self._current = 0
 
@@ -49,17 +139,34 @@ class _QuestionsIterator:
             return False
         return True
 
+    def _flush_consumed(self):
+        if not self._consumed:
+            return
+
+        consumed = self._consumed
+        self._consumed = set()
+
+        questions = self._client._questions
+        remaining = [question for question in questions if id(question) not in consumed]
+        questions.clear()
+        questions.extend(remaining)
+
     def _get_question(self):
         if self._current >= self._amount:
+            self._flush_consumed()
             raise StopIteration()
 
         while True:
-            question = next(self._questions)
+            try:
+                question = next(self._questions)
+            except StopIteration:
+                self._flush_consumed()
+                raise
             if not self._is_valid(question):
                 continue
 
             if self._consume:
-                self._client._questions.remove(question)
+                self._consumed.add(id(question))
             self._current += 1
             return question
 
@@ -71,6 +178,21 @@ class _QuestionsIterator:
             except StopIteration:
                 return questions
 
+    def close(self):
+        """Flushes pending consumption without iterating further.
+
+        Iterating to exhaustion flushes automatically; consumers that break
+        out early should call this so the questions they already retrieved
+        with ``consume=True`` leave the cache.
+        """
+
+        self._flush_consumed()
+
+    def __del__(self):
+        # safety net for consumers that neither exhaust the iterator nor call
+        # close(): consumption must not be lost on early exit
+        self._flush_consumed()
+
     def __iter__(self):
         return self
 
@@ -78,12 +200,14 @@ class _QuestionsIterator:
         return self._get_question()
 
 class _AsyncQuestionsIterator:
-    __slots__ = ('_client', '_amounts', '_decoder', '_fetched', '_params')
+    __slots__ = (
+        '_client', '_amounts', '_decoder', '_fetched', '_params', '_prefetch', '_preprocess'
+    )
 
     _DECODERS = {
-        None: html.unescape,
-        EncodingType.url: parse.unquote,
-        EncodingType.base64: lambda decodable: base64.b64decode(decodable).decode()
+        None: _unescape,
+        EncodingType.url: _decode_url,
+        EncodingType.base64: _decode_base64
     }
 
     def __init__(
@@ -98,9 +222,20 @@ class _AsyncQuestionsIterator:
         self._client = client
 
         repeat, remainder = divmod(amount, 50)
-        self._amounts = iter((*(50,) * repeat, remainder))
-        self._decoder = self._DECODERS[encoding]
+        amounts = (50,) * repeat
+        if remainder:
+            amounts += (remainder,)
+        self._amounts = iter(amounts)
+        if encoding is None:
+            # default encoding: entities are resolved in one bulk pass over the
+            # raw payload, so the per-field decoder collapses to identity
+            self._decoder = _identity
+            self._preprocess = _bulk_unescape
+        else:
+            self._decoder = self._DECODERS[encoding]
+            self._preprocess = None
         self._fetched = iter(())
+        self._prefetch = None
 
         self._params = {}
         if category is not None:
@@ -114,33 +249,95 @@ class _AsyncQuestionsIterator:
         if token is not None:
             self._params['token'] = token
 
-    def _create_questions(self, payload):
-        questions = []
-        for data in payload:
-            data['name'] = data.pop('category')
-            questions.append(Question(self._client, data, self._decoder))
-        return questions
+    async def _create_questions(self, payload):
+        # decoding large batches is CPU bound; push it off the event loop so
+        # concurrent fetches and other coroutines keep running
+        if len(payload) >= _DECODE_OFFLOAD_THRESHOLD:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, _build_questions, self._client, payload, self._decoder
+            )
+        return _build_questions(self._client, payload, self._decoder)
+
+    async def _fetch_chunk(self, amount):
+        params = {**self._params, 'amount': amount}
+        payload = await self._client._request(
+            'GET', 'api.php', preprocess=self._preprocess, params=params
+        )
+        return payload['results']
 
     async def _fetch_questions(self):
         try:
             amount = next(self._amounts)
         except StopIteration:
             raise StopAsyncIteration()
-        else:
-            if amount == 0:
-                raise StopAsyncIteration()
-            self._params['amount'] = amount
 
-        payload = await self._client._request('GET', 'api.php', params=self._params)
-        return self._create_questions(payload['results'])
+        return await self._create_questions(await self._fetch_chunk(amount))
+
+    def _schedule_prefetch(self):
+        try:
+            amount = next(self._amounts)
+        except StopIteration:
+            return
+        self._prefetch = asyncio.ensure_future(self._fetch_chunk(amount))
 
     async def flatten(self):
-        questions = []
-        while True:
-            try:
-                questions.extend(await self._fetch_questions())
-            except StopAsyncIteration:
-                return questions
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_FETCHES)
+
+        async def fetch_chunk(amount):
+            async with semaphore:
+                return await self._fetch_chunk(amount)
+
+        # an iterator that was already stepped may hold leftover questions and
+        # an in-flight prefetch; both belong to chunks consumed from _amounts,
+        # so dropping them would lose data
+        questions = list(self._fetched)
+        self._fetched = iter(())
+
+        pending = []
+        prefetch = self._prefetch
+        if prefetch is not None:
+            self._prefetch = None
+            pending.append(prefetch)
+        pending.extend(map(fetch_chunk, self._amounts))
+
+        results = []
+        for chunk in await asyncio.gather(*pending):
+            results.extend(chunk)
+        questions.extend(await self._create_questions(results))
+        return questions
+
+    async def aclose(self):
+        """Cancels the in-flight prefetch, if any.
+
+        Consumers that break out of iteration early should call this so the
+        background request does not outlive them.
+        """
+
+        prefetch = self._prefetch
+        if prefetch is None:
+            return
+        self._prefetch = None
+
+        prefetch.cancel()
+        try:
+            await prefetch
+        except (asyncio.CancelledError, Exception):
+            # the consumer is abandoning the iterator; whatever the request
+            # was going to raise is no longer interesting
+            pass
+
+    def __del__(self):
+        # safety net for consumers that neither exhaust the iterator nor call
+        # aclose(): cancel the pending request and mark a failed one as
+        # retrieved so asyncio does not log it
+        prefetch = self._prefetch
+        if prefetch is None:
+            return
+        if not prefetch.done():
+            prefetch.cancel()
+        elif not prefetch.cancelled():
+            prefetch.exception()
 
     def __aiter__(self):
         return self
@@ -150,4 +347,12 @@ class _AsyncQuestionsIterator:
             try:
                 return next(self._fetched)
             except StopIteration:
-                self._fetched = iter(await self._fetch_questions())
+                if self._prefetch is None:
+                    questions = await self._fetch_questions()
+                else:
+                    prefetch = self._prefetch
+                    self._prefetch = None
+                    questions = await self._create_questions(await prefetch)
+
+                self._schedule_prefetch()
+                self._fetched = iter(questions)
@@ -8,56 +8,63 @@
 
 import random
 
-import attr
-
 from .enums import CategoryType, DifficultyType, QuestionType
 
 __all__ = ('Category', 'Count', 'GlobalCount', 'Question')
 
-def _bypass_setter(target):
-    def new_setter(name, value):
-        object.__setattr__(target, name, value)
-
-    return new_setter
-
-def _get_category_mappings():
-    names = (
-        'General Knowledge',
-        'Entertainment: Books',
-        'Entertainment: Film',
-        'Entertainment: Music',
-        'Entertainment: Musicals & Theatres',
-        'Entertainment: Television',
-        'Entertainment: Video Games',
-        'Entertainment: Board Games',
-        'Science & Nature',
-        'Science: Computers',
-        'Science: Mathematics',
-        'Mythology',
-        'Sports',
-        'Geography',
-        'History',
-        'Politics',
-        'Art',
-        'Celebrities',
-        'Animals',
-        'Vehicles',
-        'Entertainment: Comics',
-        'Science: Gadgets',
-        'Entertainment: Japanese Anime & Manga',
-        'Entertainment: Cartoon & Animations'
-    )
-    name_mapping = {}
-    value_mapping = {}
-
-    for id, name in enumerate(names, 9):
-        name_mapping[name] = id
-        value_mapping[id] = name
-
-    return name_mapping, value_mapping
-
-@attr.s(frozen=True, slots=True, init=False)
-class Category:
+_setattr = object.__setattr__
+_sample = random.sample
+
+# direct value-to-member tables; a lookup here is cheaper than the enum call
+# protocol on the per-question hot path. category ids are dense (9..32), so
+# the category table is a tuple indexed by id - 9 instead of a dict
+_CATEGORY_TYPES = tuple(CategoryType)
+_DIFFICULTY_TYPES = DifficultyType._value_mapping
+_QUESTION_TYPES = QuestionType._value_mapping
+
+class _Frozen:
+    # neither the base nor any subclass declares __weakref__: the instances are
+    # immutable, shared flyweights where possible, and never weak-referenced
+    # internally, so each one saves the weakref slot
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError('cannot set attribute {0!r}'.format(name))
+
+    def __delattr__(self, name):
+        raise AttributeError('cannot delete attribute {0!r}'.format(name))
+
+# category names in id order (9..32); the value direction is plain tuple
+# indexing while the name-to-id direction stays a dict
+_NAMES = (
+    'General Knowledge',
+    'Entertainment: Books',
+    'Entertainment: Film',
+    'Entertainment: Music',
+    'Entertainment: Musicals & Theatres',
+    'Entertainment: Television',
+    'Entertainment: Video Games',
+    'Entertainment: Board Games',
+    'Science & Nature',
+    'Science: Computers',
+    'Science: Mathematics',
+    'Mythology',
+    'Sports',
+    'Geography',
+    'History',
+    'Politics',
+    'Art',
+    'Celebrities',
+    'Animals',
+    'Vehicles',
+    'Entertainment: Comics',
+    'Science: Gadgets',
+    'Entertainment: Japanese Anime & Manga',
+    'Entertainment: Cartoon & Animations'
+)
+_NAME_MAPPING = {name: id for id, name in enumerate(_NAMES, 9)}
+
+class Category(_Frozen):
     """Dataclass representing an OpenTDB category.
 
     Attributes
@@ -70,34 +77,65 @@ class Category:
         Type of the category.
     """
 
-    name = attr.ib()
-    id = attr.ib()
-    type = attr.ib()
-
-    _NAME_MAPPING, _VALUE_MAPPING = _get_category_mappings()
+    __slots__ = ('name', 'id', 'type')
 
     def __init__(self, data):
-        new_setter = _bypass_setter(self)
-        new_setter('name', data['name'])
-        new_setter('id', data['id'])
-        new_setter('type', CategoryType(self.id))
+        id = data['id']
+        index = id - 9
+        _setattr(self, 'name', data['name'])
+        _setattr(self, 'id', id)
+        _setattr(
+            self, 'type',
+            _CATEGORY_TYPES[index] if 0 <= index < len(_CATEGORY_TYPES) else CategoryType(id)
+        )
+
+    def __repr__(self):
+        return 'Category(name={0.name!r}, id={0.id!r}, type={0.type!r})'.format(self)
+
+    def __eq__(self, other):
+        if other.__class__ is not Category:
+            return NotImplemented
+        return (self.name, self.id, self.type) == (other.name, other.id, other.type)
+
+    def __hash__(self):
+        return hash((Category, self.name, self.id, self.type))
+
+    @classmethod
+    def _from_name(cls, client, name):
+        # fast path for question payloads, which always carry the category name
+        id = cls._NAME_MAPPING[name]
+        return client._categories.get(id) or cls._INSTANCES[id - 9]
 
     @classmethod
     def _from_partial(cls, client, data):
-        name = data.get('name')
         id = data.get('id')
-
-        if name is not None:
-            id = id or cls._NAME_MAPPING[name]
-        elif id is not None:
-            name = name or cls._VALUE_MAPPING[id]
-        else:
-            return None
-
-        return client._categories.get(id) or cls({'name': name, 'id': id})
-
-@attr.s(frozen=True, slots=True, init=False)
-class Count:
+        if id is None:
+            name = data.get('name')
+            if name is None:
+                return None
+            id = cls._NAME_MAPPING[name]
+
+        category = client._categories.get(id)
+        if category is not None:
+            return category
+
+        index = id - 9
+        if 0 <= index < len(cls._INSTANCES):
+            return cls._INSTANCES[index]
+        # ids outside the known range fall through to construction, which
+        # rejects them with the usual CategoryType error
+        return cls({'name': data.get('name'), 'id': id})
+
+# there are only 24 valid categories, so the static tables are bound on the
+# class and every instance the API can describe is prebuilt once and shared;
+# the resolvers never allocate for known ids
+Category._NAMES = _NAMES
+Category._NAME_MAPPING = _NAME_MAPPING
+Category._INSTANCES = tuple(
+    Category({'name': name, 'id': id}) for id, name in enumerate(_NAMES, 9)
+)
+
+class Count(_Frozen):
     """Dataclass representing an OpenTDB count.
 
     Attributes
@@ -114,22 +152,33 @@ class Count:
         Category that the count belongs to.
     """
 
-    total = attr.ib()
-    easy = attr.ib()
-    medium = attr.ib()
-    hard = attr.ib()
-    category = attr.ib()
+    __slots__ = ('total', 'easy', 'medium', 'hard', 'category')
 
     def __init__(self, client, data):
-        new_setter = _bypass_setter(self)
-        new_setter('total', data['total_question_count'])
-        new_setter('easy', data['total_easy_question_count'])
-        new_setter('medium', data['total_medium_question_count'])
-        new_setter('hard', data['total_hard_question_count'])
-        new_setter('category', Category._from_partial(client, data))
-
-@attr.s(frozen=True, slots=True, init=False)
-class GlobalCount:
+        _setattr(self, 'total', data['total_question_count'])
+        _setattr(self, 'easy', data['total_easy_question_count'])
+        _setattr(self, 'medium', data['total_medium_question_count'])
+        _setattr(self, 'hard', data['total_hard_question_count'])
+        _setattr(self, 'category', Category._from_partial(client, data))
+
+    def __repr__(self):
+        return (
+            'Count(total={0.total!r}, easy={0.easy!r}, medium={0.medium!r}, hard={0.hard!r}, '
+            'category={0.category!r})'
+        ).format(self)
+
+    def __eq__(self, other):
+        if other.__class__ is not Count:
+            return NotImplemented
+        return (
+            (self.total, self.easy, self.medium, self.hard, self.category)
+            == (other.total, other.easy, other.medium, other.hard, other.category)
+        )
+
+    def __hash__(self):
+        return hash((Count, self.total, self.easy, self.medium, self.hard, self.category))
+
+class GlobalCount(_Frozen):
     """Dataclass representing an OpenTDB global count.
 
     Attributes
@@ -146,22 +195,35 @@ class GlobalCount:
         Category that the global count belongs to. ``None`` for overall global count.
     """
 
-    total = attr.ib()
-    pending = attr.ib()
-    verified = attr.ib()
-    rejected = attr.ib()
-    category = attr.ib()
+    __slots__ = ('total', 'pending', 'verified', 'rejected', 'category')
 
     def __init__(self, client, data):
-        new_setter = _bypass_setter(self)
-        new_setter('total', data['total_num_of_questions'])
-        new_setter('pending', data['total_num_of_pending_questions'])
-        new_setter('verified', data['total_num_of_verified_questions'])
-        new_setter('rejected', data['total_num_of_rejected_questions'])
-        new_setter('category', Category._from_partial(client, data))
-
-@attr.s(frozen=True, slots=True, init=False)
-class Question:
+        _setattr(self, 'total', data['total_num_of_questions'])
+        _setattr(self, 'pending', data['total_num_of_pending_questions'])
+        _setattr(self, 'verified', data['total_num_of_verified_questions'])
+        _setattr(self, 'rejected', data['total_num_of_rejected_questions'])
+        _setattr(self, 'category', Category._from_partial(client, data))
+
+    def __repr__(self):
+        return (
+            'GlobalCount(total={0.total!r}, pending={0.pending!r}, verified={0.verified!r}, '
+            'rejected={0.rejected!r}, category={0.category!r})'
+        ).format(self)
+
+    def __eq__(self, other):
+        if other.__class__ is not GlobalCount:
+            return NotImplemented
+        return (
+            (self.total, self.pending, self.verified, self.rejected, self.category)
+            == (other.total, other.pending, other.verified, other.rejected, other.category)
+        )
+
+    def __hash__(self):
+        return hash(
+            (GlobalCount, self.total, self.pending, self.verified, self.rejected, self.category)
+        )
+
+class Question(_Frozen):
     """Dataclass representing an OpenTDB question.
 
     Attributes
@@ -180,26 +242,85 @@ class Question:
         Category that the question belongs to.
     """
 
-    type = attr.ib()
-    difficulty = attr.ib()
-    content = attr.ib(repr=False)
-    correct_answer = attr.ib(repr=False)
-    incorrect_answers = attr.ib(repr=False)
-    category = attr.ib()
+    __slots__ = (
+        'type', 'difficulty', 'content', 'correct_answer', 'incorrect_answers', 'category',
+        '_all_answers', '_answers'
+    )
 
     def __init__(self, client, data, decoder):
-        new_setter = _bypass_setter(self)
-        new_setter('type', QuestionType(decoder(data['type'])))
-        new_setter('difficulty', DifficultyType(decoder(data['difficulty'])))
-        new_setter('content', decoder(data['question']))
-        new_setter('correct_answer', decoder(data['correct_answer']))
-        new_setter('incorrect_answers', [decoder(answer) for answer in data['incorrect_answers']])
-        new_setter('category', Category._from_partial(client, data))
+        # straight-line body with the setter in a local, mirroring the
+        # __init__ attrs would codegen for this class
+        setter = _setattr
+        # type and difficulty are plain enum value strings that the html and
+        # url encodings never alter; only base64 payloads need the decoder
+        raw_type = data['type']
+        raw_difficulty = data['difficulty']
+        setter(self, 'type', _QUESTION_TYPES.get(raw_type) or _QUESTION_TYPES[decoder(raw_type)])
+        setter(
+            self, 'difficulty',
+            _DIFFICULTY_TYPES.get(raw_difficulty) or _DIFFICULTY_TYPES[decoder(raw_difficulty)]
+        )
+        setter(self, 'content', decoder(data['question']))
+
+        correct_answer = decoder(data['correct_answer'])
+        incorrect_answers = list(map(decoder, data['incorrect_answers']))
+        setter(self, 'correct_answer', correct_answer)
+        setter(self, 'incorrect_answers', incorrect_answers)
+        setter(self, '_all_answers', (correct_answer, *incorrect_answers))
+        setter(self, 'category', Category._from_name(client, decoder(data['name'])))
+        setter(self, '_answers', None)
+
+    def __repr__(self):
+        # content and the answer fields are deliberately omitted, matching the
+        # repr=False flags of the former attrs definition
+        return (
+            'Question(type={0.type!r}, difficulty={0.difficulty!r}, category={0.category!r})'
+        ).format(self)
+
+    def __eq__(self, other):
+        # the shuffle caches are excluded: they are derived state, not fields
+        if other.__class__ is not Question:
+            return NotImplemented
+        return (
+            (
+                self.type, self.difficulty, self.content, self.correct_answer,
+                self.incorrect_answers, self.category
+            )
+            == (
+                other.type, other.difficulty, other.content, other.correct_answer,
+                other.incorrect_answers, other.category
+            )
+        )
+
+    def __hash__(self):
+        # incorrect_answers is folded into a tuple so the hash actually works;
+        # the attrs-generated hash raised TypeError on the list field
+        return hash((
+            Question, self.type, self.difficulty, self.content, self.correct_answer,
+            tuple(self.incorrect_answers), self.category
+        ))
 
     @property
     def answers(self):
-        """List[:class:`str`]: List of shuffled answers."""
+        """Tuple[:class:`str`]: Tuple of shuffled answers.
+
+        The shuffle is computed once on first access and cached afterwards. Use
+        :meth:`~.Question.shuffled_answers` to get a fresh shuffle per call.
+        """
+
+        if self._answers is None:
+            pool = self._all_answers
+            _setattr(self, '_answers', tuple(_sample(pool, len(pool))))
+        return self._answers
+
+    def shuffled_answers(self):
+        """Returns a freshly shuffled list of all answers.
+
+        Returns
+        -------
+        List[:class:`str`]
+            List of shuffled answers.
+        """
 
-        answers = [self.correct_answer, *self.incorrect_answers]
-        random.shuffle(answers)
-        return answers
+        pool = self._all_answers
+        return _sample(pool, len(pool))